@@ -9,25 +9,64 @@
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
 from pathlib import Path
-import re
+import ast
+import json
 import os
 import sys
+import typing as t
+
+from docutils.parsers.rst import Directive
+
+if t.TYPE_CHECKING:
+    from sphinx.application import Sphinx
 
 project = "disnake-ext-pieces"
 copyright = "2022-2023, Chromosomologist, 2023-present, elenakrittik"
 author = "elenakrittik"
 
-version = ""
-with open("../disnake/ext/pieces/__init__.py") as f:
-    matches = re.search(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', f.read(), re.MULTILINE)
+_VERSION_CACHE = Path("_build/.version-cache.json")
+
+
+def _read_version(path: Path) -> str:
+    # conf.py is re-executed by every Sphinx process (one per worker with
+    # -j auto, one per rebuild with sphinx-autobuild), so the parsed version
+    # is memoized on disk keyed by the source file's stat signature.
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = json.loads(_VERSION_CACHE.read_text())
+    except (OSError, ValueError):
+        cached = None
+
+    if cached and cached.get("key") == key:
+        return cached["version"]
+
+    for node in ast.parse(path.read_bytes()).body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Constant):
+            continue
+
+        if any(
+            isinstance(target, ast.Name) and target.id == "__version__" for target in node.targets
+        ):
+            version = node.value.value
+            break
+    else:
+        raise RuntimeError(f"Could not find version string in {path}")
+
+    try:
+        _VERSION_CACHE.parent.mkdir(parents = True, exist_ok = True)
+        tmp = _VERSION_CACHE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({ "key": key, "version": version }))
+        os.replace(tmp, _VERSION_CACHE)
+    except OSError:
+        # The cache is purely an optimization; never fail the build over it.
+        pass
 
-    if not matches:
-        raise RuntimeError( \
-            "Could not find version string in disnake/ext/pieces/__init__.py" \
-        )
+    return version
 
-    version = matches.group(1)
 
+version = _read_version(Path("../disnake/ext/pieces/__init__.py"))
 release = version
 
 github_repo_url = "https://github.com/disnake-era/disnake-ext-pieces"
@@ -39,30 +78,69 @@ extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.extlinks",
     "sphinx.ext.intersphinx",
-    "sphinxcontrib.towncrier.ext",
     "sphinx_rtd_theme",
 ]
 
+# Rendering draft release notes imports towncrier and walks ../changelogs/ on
+# every build, which local docs builds (and every sphinx-autobuild rebuild)
+# don't need. Read the Docs — the only deployment that publishes the
+# changelog — exports READTHEDOCS, so the published site always renders
+# them; set PIECES_DOCS_DRAFT=1 to opt in locally.
+_draft_notes = bool(os.environ.get("PIECES_DOCS_DRAFT") or os.environ.get("READTHEDOCS"))
+
+if _draft_notes:
+    extensions.append("sphinxcontrib.towncrier.ext")
+
 templates_path = ["_templates"]
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+exclude_patterns = ["_build", "_build/.version-cache.json", "_inv", "Thumbs.db", ".DS_Store"]
 
-sys.path.insert(0, os.path.abspath(".."))
+_package_root = os.path.normpath(os.path.abspath(".."))
+if _package_root not in sys.path:
+    sys.path.insert(0, _package_root)
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
 html_theme = "sphinx_rtd_theme"
 
-# sphinxcontrib-towncrier config
-towncrier_draft_autoversion_mode = "draft"
-towncrier_draft_include_empty = False
-towncrier_draft_working_directory = Path(__file__).parent.parent
+# sphinxcontrib-towncrier config; only meaningful when the extension is
+# enabled above.
+if _draft_notes:
+    towncrier_draft_autoversion_mode = "draft"
+    towncrier_draft_include_empty = False
+    # Must be absolute: towncrier resolves this against the process CWD, which
+    # is the repo root for `pdm docs` but docs/ for a plain sphinx-build.
+    towncrier_draft_working_directory = Path(__file__).parent.parent
 
 extlinks = {
     "issue": (f"{github_repo_url}/issues/%s", "#%s"),
 }
 
+# Each target tries the committed inventory in _inv/ first (see _inv/README.md
+# for how to refresh them) and only falls back to fetching the remote
+# objects.inv when the local copy is missing. Cold builds then need no HTTP
+# round-trips at all.
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3/", None),
-    "disnake": ("https://docs.disnake.dev/en/stable/", None),
+    "python": ("https://docs.python.org/3/", ("_inv/python-3.inv", None)),
+    "disnake": ("https://docs.disnake.dev/en/stable/", ("_inv/disnake-stable.inv", None)),
 }
+
+
+def setup(app: "Sphinx") -> None:
+    """Keep the unconditional towncrier directive in changelog.rst harmless.
+
+    changelog.rst always contains ``.. towncrier-draft-entries::``; regular
+    builds don't load sphinxcontrib-towncrier, so register a no-op stand-in
+    for its directive there.
+    """
+    if _draft_notes:
+        return
+
+    class _DraftEntriesStub(Directive):
+        optional_arguments = 1
+        final_argument_whitespace = True
+
+        def run(self: "_DraftEntriesStub") -> t.List[t.Any]:
+            return []
+
+    app.add_directive("towncrier-draft-entries", _DraftEntriesStub)